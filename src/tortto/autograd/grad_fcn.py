@@ -1136,6 +1136,8 @@ class CopySlices(Function):
         xt0, xt1 = inputs
         x0, x1 = xt0.data, xt1.data
         key = params['key']
+        req_grad = ctx.needs_input_grad
+        xp = ctx.xp
         flag = None
         if x0.__class__ is cparray and x1.__class__ is not cparray:
             x1 = cp.array(x1)
@@ -1143,24 +1145,28 @@ class CopySlices(Function):
         elif x0.__class__ is not cparray and x1.__class__ is cparray:
             x1 = x1.get()
             flag = False
+        # scalar written through a full-shape boolean mask: its grad is reduced without gathering g0[key]
+        bool_key = x1.ndim == 0 and isinstance(key, xp.ndarray) and key.dtype.type is np.bool_ and key.shape == x0.shape
         inplace_precheck(xt0)
         x0[key] = x1
         yt0 = inplace_update(xt0, ctx)
-        ctx.params['arrays'] = flag if ctx.needs_input_grad[1] else None
+        ctx.params['arrays'] = (bool_key if req_grad[1] else None, flag if req_grad[1] else None)
         ctx.params['property'] = x1.shape
         return yt0
 
     @staticmethod
     def backward(ctx, *grad_outputs):
         g0, = grad_outputs
-        flag = ctx.params['arrays']
+        bool_key, flag = ctx.params['arrays']
         x1_shape = ctx.params['property']
         key = ctx.params['key']
+        xp = ctx.xp
         req_grad = ctx.needs_input_grad
         grad0, grad1 = None, None
         if req_grad[1]:
             # grad for value. Do this first because gd0 will be changed inplace next
-            grad1 = reverse_broadcast(g0[key], x1_shape)
+            # g0[key] is a view for basic indexing, but a gathered copy for boolean masks
+            grad1 = xp.where(key, g0, g0.dtype.type(0)).sum() if bool_key else reverse_broadcast(g0[key], x1_shape)
             if flag is True:
                 grad1 = grad1.get()
             elif flag is False:
@@ -1193,18 +1199,19 @@ class Copy(Function):
     def backward(ctx, *grad_outputs):
         g0, = grad_outputs
         flag = ctx.params['arrays']
+        xp = ctx.xp
         req_grad = ctx.needs_input_grad
         grad0, grad1 = None, None
         if req_grad[1]:
-            # grad for value. Do this first because gd0 will be changed inplace next
-            grad1 = g0
+            grad1 = g0  # grad for value
             if flag is True:
                 grad1 = grad1.get()
             elif flag is False:
                 grad1 = cp.array(grad1)
         if req_grad[0]:
-            grad0 = g0  # grad for input
-            grad0[...] = 0
+            # input is fully overwritten, its grad is all zeros. Allocate it instead of zeroing g0 inplace,
+            # which would take a pass over g0 and also wipe grad1 since it is g0 itself
+            grad0 = xp.zeros(g0.shape, dtype=g0.dtype)
         return grad0, grad1
 
 
@@ -1214,24 +1221,30 @@ class MaskedFill(Function):
         xt0, xt1 = inputs
         x0, x1 = xt0.data, xt1.data
         mask = params['mask']
+        xp = ctx.xp
         if x1.ndim > 0:
             raise RuntimeError(f"masked_fill only supports a 0-dimensional value tensor, "
                                f"but got tensor with {x1.ndim} dimension(s).")
         if mask.dtype.type is not np.bool_:
             raise RuntimeError(f"dtype of mask must be bool. Pass dtype=bool when constructing mask")
+        if mask.ndim > x0.ndim or mask.shape != x0.shape[x0.ndim - mask.ndim:]:
+            raise RuntimeError(f"masked_fill: shape of mask {mask.shape} must match the trailing dimensions "
+                               f"of the input tensor {x0.shape}")
         flag = False
         if x0.__class__ is cparray and x1.__class__ is not cparray:  # xd1 is a scaler, no need to convert it to cparray
             flag = True
         elif x0.__class__ is not cparray and x1.__class__ is cparray:
             raise RuntimeError(f"masked_fill: Expected inputs to be on same device")
-        key = (slice(None),) * (x0.ndim - mask.ndim) + (mask.data,)
         if params['inplace']:
             inplace_precheck(xt0)
-            x0[key] = x1
+            xp.copyto(x0, x1.item() if flag else x1, casting='unsafe', where=mask.data)
             yt0 = inplace_update(xt0, ctx)
         else:
-            y0 = x0.copy()
-            y0[key] = x1
+            # a single elementwise pass instead of copy followed by boolean index assignment
+            if x0.__class__ is cparray:
+                y0 = masked_fill_kernel()(x0, mask.data, x1.item() if flag else x1.astype(x0.dtype, copy=False))
+            else:
+                y0 = np.where(mask.data, x1.astype(x0.dtype, copy=False), x0)
             yt0 = build_links(y0, grad_fn=ctx)
         ctx.params['arrays'] = flag if ctx.needs_input_grad[1] else None
         return yt0
@@ -1241,15 +1254,15 @@ class MaskedFill(Function):
         g0, = grad_outputs
         flag = ctx.params['arrays']
         mask = ctx.params['mask']
+        xp = ctx.xp
         req_grad = ctx.needs_input_grad
-        leading = (slice(None),) * (g0.ndim - mask.ndim)
-        key = leading + (mask.data,)
         grad0, grad1 = None, None
         if req_grad[1]:
-            grad1 = g0[key].sum()
+            grad1 = xp.where(mask.data, g0, g0.dtype.type(0)).sum()  # no gathered temporary of the masked elements
             if flag:
                 grad1 = grad1.get()
         if req_grad[0]:
+            # zero g0 inplace, grad1 has already been reduced from it
+            xp.copyto(g0, g0.dtype.type(0), where=mask.data)
             grad0 = g0
-            grad0[key] = 0
         return grad0, grad1
@@ -1,6 +1,5 @@
 from .function import *
 from .helper import *
-from tortto import np
 
 """
 contain functions that can't be generated by grad_fcn_generator 
@@ -17,18 +16,11 @@ class Split(Function):  # keep input _version: True
         dim_size = x0.shape[dim]
         if dim < 0:
             dim += x0.ndim
+        leading = (slice(None),) * dim
         if split_size_or_sections.__class__ is int:
             split_size = split_size_or_sections
             ytn = tuple(
-                build_links(
-                    x0[
-                        tuple(
-                            slice(None) if i != dim else slice(j, j + split_size) for i in range(x0.ndim)
-                        )
-                    ],
-                    grad_fn=ctx,
-                    _output_idx=j // split_size
-                )
+                build_links(x0[leading + (slice(j, j + split_size),)], grad_fn=ctx, _output_idx=j // split_size)
                 for j in range(0, dim_size, split_size)
             )
         else:
@@ -36,40 +28,37 @@ class Split(Function):  # keep input _version: True
             if sum(sections) != dim_size:
                 raise RuntimeError(f"split_with_sizes expects split_sizes to sum exactly to {dim_size} "
                                    f"(input tensor's size at dimension {dim}), but got split_sizes={sections}")
-            sum_sections = np.cumsum(split_size_or_sections)
-            ytn = tuple(
-                build_links(
-                    x0[
-                        tuple(
-                            slice(None) if i != dim else slice(sum_sections[j] - sec, sum_sections[j]) for i in
-                            range(x0.ndim)
-                        )
-                    ],
-                    grad_fn=ctx,
-                    _output_idx=j
-                )
-                for j, sec in enumerate(sections)
-            )
-        ctx.save_for_backward(xt0)
+            ytn = []
+            end = 0
+            for j, sec in enumerate(sections):
+                end += sec
+                ytn.append(build_links(x0[leading + (slice(end - sec, end),)], grad_fn=ctx, _output_idx=j))
+            ytn = tuple(ytn)
+        ctx.params['dim'] = dim
         ctx.params['output_shapes'] = tuple(yt.shape for yt in ytn)
+        ctx.params['property'] = (x0.shape, x0.dtype)  # input is not saved, only its shape and dtype are needed
         return ytn
 
     @staticmethod
     def backward(ctx, *grad_outputs):
-        x0, = ctx.saved_tensors
         dim = ctx.params['dim']
         output_shapes = ctx.params['output_shapes']
+        x0_shape, x0_dtype = ctx.params['property']
         xp = ctx.xp
-        grad0 = xp.concatenate(
-            [
-                xp.zeros(output_shapes[i], dtype=x0.dtype) if gn is None else gn
-                for i, gn in enumerate(grad_outputs)
-            ],
-            axis=dim
-        )
+        # write each grad into its slice of a single buffer, slices without grad are filled with zeros
+        grad0 = xp.empty(x0_shape, dtype=x0_dtype)
+        leading = (slice(None),) * dim
+        offset = 0
+        for shape, gn in zip(output_shapes, grad_outputs):
+            key = leading + (slice(offset, offset + shape[dim]),)
+            grad0[key] = 0 if gn is None else gn
+            offset += shape[dim]
         return grad0
 
 
+_expand_cache = {}  # (input shape, input strides, sizes) -> (output strides, axes summed in backward)
+
+
 class Expand(Function):  # keep input _version: True
     @staticmethod
     def forward(ctx, *inputs, **params):
@@ -77,35 +66,44 @@ class Expand(Function):  # keep input _version: True
         x0 = xt0.data
         sizes = params['sizes']
         xp = ctx.xp
-        leading_dims = len(sizes) - len(x0.shape)
-        strides = [0] * leading_dims + list(x0.strides)
-        x0_singleton_dims = []  # singleton axes to be summed during backward
-        for i in range(len(sizes)):
-            if i < leading_dims:  # leading dimensions
-                if sizes[i] <= 0:
-                    raise RuntimeError(f"The expanded size of the tensor ({sizes[i]}) isn't allowed in a leading, "
-                                       f"non-existing dimension {i}")
-            else:
-                i -= len(sizes)  # for non-leading dimensions, count backward
-                if x0.shape[i] == 1:
-                    if sizes[i] > 1:
-                        x0_singleton_dims.append(i)
-                        strides[i] = 0
+        # shapes are static across iterations, validate each (shape, strides, sizes) combination only once
+        cache_key = (x0.shape, x0.strides, tuple(sizes))
+        cached = _expand_cache.get(cache_key)
+        if cached is None:
+            leading_dims = len(sizes) - len(x0.shape)
+            strides = [0] * leading_dims + list(x0.strides)
+            x0_singleton_dims = []  # singleton axes to be summed during backward
+            for i in range(len(sizes)):
+                if i < leading_dims:  # leading dimensions
+                    if sizes[i] <= 0:
+                        raise RuntimeError(f"The expanded size of the tensor ({sizes[i]}) isn't allowed in a leading, "
+                                           f"non-existing dimension {i}")
                 else:
-                    if sizes[i] != -1 and x0.shape[i] != sizes[i]:
-                        raise RuntimeError(f"The expanded size of the tensor ({sizes[i]}) must match the existing size "
-                                           f"({x0.shape[i]}) at non-singleton dimension {i + len(sizes)}.  "
-                                           f"Target sizes: {sizes}.  Tensor sizes: {x0.shape}")
+                    i -= len(sizes)  # for non-leading dimensions, count backward
+                    if x0.shape[i] == 1:
+                        if sizes[i] > 1:
+                            x0_singleton_dims.append(i)
+                            strides[i] = 0
+                    else:
+                        if sizes[i] != -1 and x0.shape[i] != sizes[i]:
+                            raise RuntimeError(f"The expanded size of the tensor ({sizes[i]}) must match the existing "
+                                               f"size ({x0.shape[i]}) at non-singleton dimension {i + len(sizes)}.  "
+                                               f"Target sizes: {sizes}.  Tensor sizes: {x0.shape}")
+            # sum leading and singleton axes in one reduction, then reshape back to input shape
+            cached = _expand_cache[cache_key] = (tuple(strides), tuple(range(leading_dims)) + tuple(x0_singleton_dims))
+        strides, sum_dims = cached
         y0 = xp.lib.stride_tricks.as_strided(x0, shape=sizes, strides=strides)  # a numpy/cupy array
         yt0 = build_links(y0, grad_fn=ctx)  # convert to a new nparray/cparray, version is 0
         yt0.data._version = x0._version  # keep version
-        ctx.params = {'x0_singleton_dims': x0_singleton_dims, 'leading_dims': leading_dims}
+        ctx.params = {'sum_dims': sum_dims, 'property': x0.shape}
         return yt0
 
     @staticmethod
     def backward(ctx, *grad_outputs):
         g0, = grad_outputs
-        x0_singleton_dims = tuple(ctx.params['x0_singleton_dims'])
-        leading_dims = tuple(range(ctx.params['leading_dims']))
-        grad0 = g0.sum(x0_singleton_dims + leading_dims, keepdims=True).squeeze(leading_dims)
+        sum_dims = ctx.params['sum_dims']
+        if not sum_dims:  # expanded to its own shape, sum over no axes would only copy g0
+            return g0
+        x0_shape = ctx.params['property']
+        grad0 = g0.sum(sum_dims).reshape(x0_shape)
         return grad0
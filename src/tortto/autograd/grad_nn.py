@@ -370,6 +370,39 @@ class Softmax(Function):
         return grad0
 
 
+class MaskedSoftmax(Function):
+    """
+    softmax(input.masked_fill(mask, -inf), dim) without materializing the filled input.
+    intermediate results are computed inplace on one buffer.
+    """
+    @staticmethod
+    def forward(ctx, *inputs, **params):
+        xt0, = inputs
+        xd0 = xt0.data
+        dim = params['dim']
+        mask = params['mask']
+        if mask.dtype.type is not np.bool_:
+            raise RuntimeError(f"dtype of mask must be bool. Pass dtype=bool when constructing mask")
+        if mask.ndim > xd0.ndim or mask.shape != xd0.shape[xd0.ndim - mask.ndim:]:
+            raise RuntimeError(f"masked_softmax: shape of mask {mask.shape} must match the trailing dimensions "
+                               f"of the input tensor {xd0.shape}")
+        xp = ctx.xp
+        yd0 = xp.where(mask.data, xd0.dtype.type(-math.inf), xd0)
+        yd0 -= xp.max(yd0, axis=dim, keepdims=True)
+        xp.exp(yd0, out=yd0)
+        yd0 /= xp.sum(yd0, axis=dim, keepdims=True)
+        yt0 = build_links(yd0, grad_fn=ctx)
+        ctx.save_for_backward(yt0)
+        return yt0
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        gd0, = grad_outputs
+        dim = ctx.params['dim']
+        yd0, = ctx.saved_tensors
+        grad0 = (gd0 - (gd0 * yd0).sum(dim, keepdims=True)) * yd0  # masked positions have yd0 == 0
+        return grad0
+
+
 class LogSoftmax(Function):
     @staticmethod
     def forward(ctx, *inputs, **params):
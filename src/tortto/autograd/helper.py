@@ -42,6 +42,19 @@ def reverse_broadcast(result, target_shape: tuple):
     return result
 
 
+_masked_fill_kernel = [None]
+
+
+def masked_fill_kernel():
+    """
+    cupy elementwise kernel for y = m ? v : x, where `v` can be a python scalar passed by value.
+    Created on first use, cupy then compiles and caches it per dtype.
+    """
+    if _masked_fill_kernel[0] is None:
+        _masked_fill_kernel[0] = tt.cp.ElementwiseKernel('T x, bool m, T v', 'T y', 'y = m ? v : x', 'masked_fill')
+    return _masked_fill_kernel[0]
+
+
 def build_links(data, grad_fn, copy=False, _output_idx=0):
     requires_grad = grad_fn.requires_grad & is_grad_enabled()
     if requires_grad:
@@ -43,6 +43,10 @@ def softmax(input, dim):
     return Softmax.apply(input, dim=dim)
 
 
+def masked_softmax(input, mask, dim):
+    return MaskedSoftmax.apply(input, mask=mask, dim=dim)
+
+
 def log_softmax(input, dim):
     return LogSoftmax.apply(input, dim=dim)
 